@@ -1,4 +1,5 @@
 import shutil
+import tarfile
 from pathlib import Path
 from typing import Generator
 
@@ -14,15 +15,18 @@ _imc_test_data_asset_url = (
 _imc_test_data_raw_dir = "datasets/210308_ImcTestData/raw"
 _imc_test_data_mcd_file = "20210305_NE_mockData1/20210305_NE_mockData1.mcd"
 _imc_test_data_txt_file = "20210305_NE_mockData1/20210305_NE_mockData1_ROI_001_1.txt"
+_damond_mcd_file = "data/Damond2019/20170814_G_SE.mcd"
+_asset_chunk_size = 64 * 1024
 
 
 def _download_and_extract_asset(tmp_dir_path: Path, asset_url: str):
-    asset_file_path = tmp_dir_path / "asset.tar.gz"
-    response = requests.get(asset_url, stream=True)
-    if response.status_code == 200:
-        with asset_file_path.open(mode="wb") as f:
-            f.write(response.raw.read())
-    shutil.unpack_archive(asset_file_path, tmp_dir_path)
+    with requests.get(asset_url, stream=True) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        with tarfile.open(
+            fileobj=response.raw, mode="r|gz", bufsize=_asset_chunk_size
+        ) as tar:
+            tar.extractall(tmp_dir_path)
 
 
 @pytest.fixture(scope="session")
@@ -49,3 +53,9 @@ def imc_test_data_txt_file(
     path = imc_test_data_raw_path / Path(_imc_test_data_txt_file)
     with TXTFile(path) as f:
         yield f
+
+
+@pytest.fixture(scope="session")
+def damond_mcd_file() -> Generator[MCDFile, None, None]:
+    with MCDFile(Path(_damond_mcd_file)) as f:
+        yield f
@@ -1,6 +1,7 @@
 import math
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
@@ -122,15 +123,17 @@ class Acquisition(AcquisitionBase):
     @property
     def width_um(self) -> Optional[float]:
         """Acquisition width, in micrometers"""
-        if self.width_px is not None and self.pixel_size_x_um is not None:
-            return self.width_px * self.pixel_size_x_um
+        width_px, pixel_size_x_um = self.width_px, self.pixel_size_x_um
+        if width_px is not None and pixel_size_x_um is not None:
+            return width_px * pixel_size_x_um
         return None
 
     @property
     def height_um(self) -> Optional[float]:
         """Acquisition height, in micrometers"""
-        if self.height_px is not None and self.pixel_size_y_um is not None:
-            return self.height_px * self.pixel_size_y_um
+        height_px, pixel_size_y_um = self.height_px, self.pixel_size_y_um
+        if height_px is not None and pixel_size_y_um is not None:
+            return height_px * pixel_size_y_um
         return None
 
     @property
@@ -149,6 +152,18 @@ class Acquisition(AcquisitionBase):
     def channel_labels(self) -> Sequence[str]:
         return self._channel_labels
 
+    @cached_property
+    def channel_names(self) -> Sequence[str]:
+        """Unique channel names in the format ``f"{metal}{mass}"`` (e.g.
+        ``["Ag107", "Ir191"]``)"""
+        # channel metals and masses are fixed at construction, build names once
+        return [
+            f"{channel_metal}{channel_mass}"
+            for channel_metal, channel_mass in zip(
+                self._channel_metals, self._channel_masses
+            )
+        ]
+
     @property
     def roi_coords_um(
         self,
@@ -167,6 +182,7 @@ class Acquisition(AcquisitionBase):
         y1_str = self.metadata.get("ROIStartYPosUm")
         x3_str = self.metadata.get("ROIEndXPosUm")
         y3_str = self.metadata.get("ROIEndYPosUm")
+        width_um, height_um = self.width_um, self.height_um
         if (
             x1_str != x3_str
             and y1_str != y3_str
@@ -174,8 +190,8 @@ class Acquisition(AcquisitionBase):
             and y1_str is not None
             and x3_str is not None
             and y3_str is not None
-            and self.width_um is not None
-            and self.height_um is not None
+            and width_um is not None
+            and height_um is not None
         ):
             x1, y1 = float(x1_str), float(y1_str)
             x3, y3 = float(x3_str), float(y3_str)
@@ -186,18 +202,20 @@ class Acquisition(AcquisitionBase):
                 y1 /= 1000.0
             # calculate counter-clockwise rotation angle, in radians
             rotated_main_diag_angle = np.arctan2(y1 - y3, x1 - x3)
-            main_diag_angle = np.arctan2(self.height_um, -self.width_um)
+            main_diag_angle = np.arctan2(height_um, -width_um)
             angle = rotated_main_diag_angle - main_diag_angle
             # calculate missing points (generative approach)
-            x2, y2 = self.width_um / 2.0, self.height_um / 2.0
-            x4, y4 = -self.width_um / 2.0, -self.height_um / 2.0
+            x2, y2 = width_um / 2.0, height_um / 2.0
+            x4, y4 = -width_um / 2.0, -height_um / 2.0
+            cos_angle, sin_angle = math.cos(angle), math.sin(angle)
+            center_x, center_y = (x1 + x3) / 2.0, (y1 + y3) / 2.0
             x2, y2 = (
-                math.cos(angle) * x2 - math.sin(angle) * y2 + (x1 + x3) / 2.0,
-                math.sin(angle) * x2 + math.cos(angle) * y2 + (y1 + y3) / 2.0,
+                cos_angle * x2 - sin_angle * y2 + center_x,
+                sin_angle * x2 + cos_angle * y2 + center_y,
             )
             x4, y4 = (
-                math.cos(angle) * x4 - math.sin(angle) * y4 + (x1 + x3) / 2.0,
-                math.sin(angle) * x4 + math.cos(angle) * y4 + (y1 + y3) / 2.0,
+                cos_angle * x4 - sin_angle * y4 + center_x,
+                sin_angle * x4 + cos_angle * y4 + center_y,
             )
             return ((x1, y1), (x2, y2), (x3, y3), (x4, y4))
         return None
@@ -31,8 +31,9 @@ class Panorama:
     @property
     def width_um(self) -> Optional[float]:
         """Panorama width, in micrometers"""
-        if self.points_um is not None:
-            (x1, y1), (x2, y2), (x3, y3), (x4, y4) = self.points_um
+        points_um = self.points_um
+        if points_um is not None:
+            (x1, y1), (x2, y2), (x3, y3), (x4, y4) = points_um
             w1 = ((x1 - x2) ** 2.0 + (y1 - y2) ** 2.0) ** 0.5
             w2 = ((x3 - x4) ** 2.0 + (y3 - y4) ** 2.0) ** 0.5
             if abs(w1 - w2) > 0.001:
@@ -43,8 +44,9 @@ class Panorama:
     @property
     def height_um(self) -> Optional[float]:
         """Panorama height, in micrometers"""
-        if self.points_um is not None:
-            (x1, y1), (x2, y2), (x3, y3), (x4, y4) = self.points_um
+        points_um = self.points_um
+        if points_um is not None:
+            (x1, y1), (x2, y2), (x3, y3), (x4, y4) = points_um
             h1 = ((x1 - x4) ** 2.0 + (y1 - y4) ** 2.0) ** 0.5
             h2 = ((x2 - x3) ** 2.0 + (y2 - y3) ** 2.0) ** 0.5
             if abs(h1 - h2) > 0.001:
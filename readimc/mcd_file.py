@@ -1,9 +1,14 @@
 import mmap
+import operator
+import os
+from concurrent.futures import ThreadPoolExecutor
+from io import BufferedReader
 from os import PathLike
-from typing import BinaryIO, List, Optional, Sequence, Union
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 from warnings import warn
 
 import numpy as np
+import numpy.typing as npt
 from imageio.v2 import imread
 
 from .data import Acquisition, Panorama, Slide
@@ -12,13 +17,15 @@ from .mcd_parser import MCDParser, MCDParserError
 
 
 class MCDFile(IMCFile):
+    _SCATTER_BLOCK_SIZE = 16384  # pixels
+
     def __init__(self, path: Union[str, PathLike]) -> None:
         """A class for reading IMC .mcd files
 
         :param path: path to the IMC .mcd file
         """
         super(MCDFile, self).__init__(path)
-        self._fh: Optional[BinaryIO] = None
+        self._fh: Optional[BufferedReader] = None
         self._schema_xml: Optional[str] = None
         self._slides: Optional[List[Slide]] = None
 
@@ -40,9 +47,22 @@ class MCDFile(IMCFile):
 
     @property
     def slides(self) -> Sequence[Slide]:
-        """Metadata on slides contained in this IMC .mcd file"""
+        """Metadata on slides contained in this IMC .mcd file
+
+        The slide metadata is parsed from the MCD-XML on first access; an
+        ``IOError`` is raised here if the slide information is corrupted.
+        """
         if self._slides is None:
-            raise IOError(f"MCD file '{self.path.name}' has not been opened")
+            if self._schema_xml is None:
+                raise IOError(f"MCD file '{self.path.name}' has not been opened")
+            # parsed on first access, reading acquisition data does not need it
+            try:
+                self._slides = MCDParser(self._schema_xml).parse_slides()
+            except MCDParserError as e:
+                raise IOError(
+                    f"MCD file '{self.path.name}' corrupted: "
+                    "error parsing slide information from MCD-XML"
+                ) from e
         return self._slides
 
     def __enter__(self) -> "MCDFile":
@@ -55,6 +75,9 @@ class MCDFile(IMCFile):
     def open(self) -> None:
         """Opens the IMC .mcd file for reading.
 
+        Slide metadata is parsed on first access to ``slides``, so corrupted
+        slide information in the MCD-XML is reported there and not here.
+
         It is good practice to use context managers whenever possible:
 
         .. code-block:: python
@@ -67,13 +90,7 @@ class MCDFile(IMCFile):
             self._fh.close()
         self._fh = open(self._path, mode="rb")
         self._schema_xml = self._read_schema_xml()
-        try:
-            self._slides = MCDParser(self._schema_xml).parse_slides()
-        except MCDParserError as e:
-            raise IOError(
-                f"MCD file '{self.path.name}' corrupted: "
-                "error parsing slide information from MCD-XML"
-            ) from e
+        self._slides = None
 
     def close(self) -> None:
         """Closes the IMC .mcd file.
@@ -91,17 +108,47 @@ class MCDFile(IMCFile):
             self._fh = None
 
     def read_acquisition(
-        self, acquisition: Optional[Acquisition] = None, strict: bool = True
+        self,
+        acquisition: Optional[Acquisition] = None,
+        strict: bool = True,
+        use_memmap: bool = True,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        channels: Union[Sequence[int], np.ndarray, None] = None,
+        out: Optional[np.ndarray] = None,
+        dtype: npt.DTypeLike = np.float32,
     ) -> np.ndarray:
         """Reads IMC acquisition data as numpy array.
 
         :param acquisition: the acquisition to read
         :param strict: set this parameter to False to try to recover corrupted data
-        :return: the acquisition data as 32-bit floating point array,
-            shape: (c, y, x)
+        :param use_memmap: set this parameter to False to read the acquisition data
+            into memory instead of memory-mapping it (e.g. on network file systems)
+        :param region: the image region to read, as ``(x_min, y_min, x_max, y_max)``
+            pixel coordinates (maximum exclusive); if the pixels are stored in
+            row-major order, only the image rows covering the region are read
+        :param channels: indices of the channels to read, in the specified order,
+            as sequence or integer array (default: all channels)
+        :param out: C-contiguous array of the resulting shape and data type to
+            write the acquisition data to, e.g. a ``numpy.memmap`` for
+            acquisitions that do not fit into memory (default: allocate new array)
+        :param dtype: floating point data type of the returned array; e.g.
+            ``numpy.float16`` halves the memory footprint at reduced precision
+        :return: the acquisition data as 32-bit (or the specified) floating point
+            array, shape: (c, y, x)
         """
         if acquisition is None:
             raise ValueError("acquisition")
+        dtype = np.dtype(dtype)
+        if not np.issubdtype(dtype, np.floating):
+            raise ValueError("dtype")
+        if region is not None:
+            try:
+                x_min, y_min, x_max, y_max = map(operator.index, region)
+            except TypeError as e:
+                raise ValueError("region") from e
+            if not (0 <= x_min < x_max and 0 <= y_min < y_max):
+                raise ValueError("region")
+            region = (x_min, y_min, x_max, y_max)
         if self._fh is None:
             raise IOError(f"MCD file '{self.path.name}' has not been opened")
         try:
@@ -121,6 +168,16 @@ class MCDFile(IMCFile):
         if value_bytes <= 0:
             raise IOError("MCD file corrupted: invalid byte size")
         num_channels = acquisition.num_channels
+        columns: Union[slice, List[int]] = slice(3, None)
+        if channels is not None:
+            try:
+                channels = [operator.index(c) for c in channels]
+            except TypeError as e:
+                raise ValueError("channels") from e
+            if len(channels) == 0 or not all(0 <= c < num_channels for c in channels):
+                raise ValueError("channels")
+            columns = [3 + c for c in channels]
+        num_img_channels = num_channels if channels is None else len(channels)
         data_size = data_end_offset - data_start_offset
         bytes_per_pixel = (num_channels + 3) * value_bytes
         if data_size % bytes_per_pixel != 0:
@@ -136,20 +193,34 @@ class MCDFile(IMCFile):
                 "invalid acquisition image data size"
             )
         num_pixels = data_size // bytes_per_pixel
-        self._fh.seek(0)
-        data = np.memmap(
-            self._fh,
-            dtype=np.float32,
-            mode="r",
-            offset=data_start_offset,
-            shape=(num_pixels, num_channels + 3),
+        if region is not None:
+            img = self._create_image(
+                (num_img_channels, y_max - y_min, x_max - x_min), dtype, out
+            )
+            if self._read_acquisition_region(
+                acquisition,
+                data_start_offset,
+                num_pixels,
+                region,
+                columns,
+                use_memmap,
+                img,
+            ):
+                return img
+        data = self._read_acquisition_data(
+            data_start_offset, num_pixels, num_channels, use_memmap
         )
-        xs = data[:, 0].astype(int)
-        ys = data[:, 1].astype(int)
+        if region is None:
+            xs = data[:, 0].astype(np.intp)
+            ys = data[:, 1].astype(np.intp)
+        else:  # cast after selecting the region, float32 is half the size of intp
+            xs = np.ascontiguousarray(data[:, 0])
+            ys = np.ascontiguousarray(data[:, 1])
+        max_x, max_y = int(xs.max()), int(ys.max())
         try:
             width = int(acquisition.metadata["MaxX"])
             height = int(acquisition.metadata["MaxY"])
-            if width <= np.amax(xs) or height <= np.amax(ys):
+            if width <= max_x or height <= max_y:
                 raise ValueError(
                     "data shape is incompatible with acquisition image dimensions"
                 )
@@ -158,8 +229,8 @@ class MCDFile(IMCFile):
                 f"MCD file '{self.path.name}' corrupted: "
                 "cannot read acquisition image dimensions; recovering from data shape"
             )
-            width = np.amax(xs) + 1
-            height = np.amax(ys) + 1
+            width = max_x + 1
+            height = max_y + 1
         if width * height != data.shape[0]:
             if strict:
                 raise IOError(
@@ -170,10 +241,196 @@ class MCDFile(IMCFile):
                 f"MCD file '{self.path.name}' corrupted: "
                 "inconsistent acquisition image data size"
             )
-        img = np.zeros((num_channels, height, width), dtype=np.float32)
-        img[:, ys, xs] = np.transpose(data[:, 3:])
+        full_image = region is None
+        if region is None:
+            region = (0, 0, width, height)
+        elif region[2] > width or region[3] > height:
+            raise ValueError("region")
+        x_min, y_min, x_max, y_max = region
+        record_indices = None
+        if region != (0, 0, width, height):
+            record_indices = np.flatnonzero(
+                (xs >= x_min) & (xs < x_max) & (ys >= y_min) & (ys < y_max)
+            )
+            xs = xs[record_indices].astype(np.intp) - x_min
+            ys = ys[record_indices].astype(np.intp) - y_min
+        else:
+            xs = xs.astype(np.intp, copy=False)
+            ys = ys.astype(np.intp, copy=False)
+        # computed in place, acquisitions can have millions of pixels
+        pixel_indices = ys
+        pixel_indices *= x_max - x_min
+        pixel_indices += xs
+        # pixels stored in row-major order cover the image exactly once, so the
+        # image is only zero-filled from the first block that is out of order on
+        row_major = record_indices is None and width * height == len(pixel_indices)
+        if full_image:
+            img = self._create_image(
+                (num_img_channels, height, width), dtype, out, zero=not row_major
+            )
+        img_data = img.reshape(num_img_channels, (y_max - y_min) * (x_max - x_min))
+        # scatter block by block: transposing all pixels at once is cache-unfriendly
+        # and slower than the scatter itself, even for row-major pixel orders
+        for start in range(0, len(pixel_indices), self._SCATTER_BLOCK_SIZE):
+            stop = start + self._SCATTER_BLOCK_SIZE
+            if record_indices is None:
+                block = data[start:stop, columns]
+            else:
+                block = data[record_indices[start:stop]][:, columns]
+            block_indices = pixel_indices[start:stop]
+            if row_major and not np.array_equal(
+                block_indices, np.arange(start, start + len(block_indices))
+            ):
+                img_data[:, start:] = 0  # previous blocks filled [0, start) exactly
+                row_major = False
+            img_data[:, block_indices] = np.transpose(block)
         return img
 
+    def read_acquisitions(
+        self,
+        acquisitions: Sequence[Acquisition],
+        strict: bool = True,
+        max_workers: Optional[int] = None,
+    ) -> List[np.ndarray]:
+        """Reads multiple IMC acquisitions concurrently as numpy arrays.
+
+        :param acquisitions: the acquisitions to read
+        :param strict: set this parameter to False to try to recover corrupted data
+        :param max_workers: maximum number of threads to use for reading
+            (default: ``concurrent.futures.ThreadPoolExecutor`` default)
+        :return: the acquisition data as 32-bit floating point arrays, in the
+            order of the specified acquisitions, shape: (c, y, x)
+        """
+        if self._fh is None:
+            raise IOError(f"MCD file '{self.path.name}' has not been opened")
+        if not hasattr(os, "pread"):  # seek + read is not thread-safe
+            max_workers = 1
+
+        def get_data_start_offset(i: int) -> int:
+            try:
+                return int(acquisitions[i].metadata["DataStartOffset"])
+            except (KeyError, ValueError):
+                return -1  # reported by read_acquisition
+
+        # read in file order, so that I/O moves forward through the file
+        indices = sorted(range(len(acquisitions)), key=get_data_start_offset)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            imgs = dict(
+                zip(
+                    indices,
+                    executor.map(
+                        lambda i: self.read_acquisition(
+                            acquisition=acquisitions[i], strict=strict
+                        ),
+                        indices,
+                    ),
+                )
+            )
+        return [imgs[i] for i in range(len(acquisitions))]
+
+    def _read_acquisition_region(
+        self,
+        acquisition: Acquisition,
+        data_start_offset: int,
+        num_pixels: int,
+        region: Tuple[int, int, int, int],
+        columns: Union[slice, List[int]],
+        use_memmap: bool,
+        img: np.ndarray,
+    ) -> bool:
+        try:
+            width = int(acquisition.metadata["MaxX"])
+            height = int(acquisition.metadata["MaxY"])
+        except (KeyError, ValueError):
+            return False
+        if width <= 0 or width * height != num_pixels:
+            return False
+        x_min, y_min, x_max, y_max = region
+        if x_max > width or y_max > height:
+            raise ValueError("region")
+        num_channels = acquisition.num_channels
+        bytes_per_pixel = (num_channels + 3) * 4
+        data = self._read_acquisition_data(
+            data_start_offset + y_min * width * bytes_per_pixel,
+            (y_max - y_min) * width,
+            num_channels,
+            use_memmap,
+        ).reshape(y_max - y_min, width, num_channels + 3)
+        xs = np.arange(width)
+        block_rows = max(1, self._SCATTER_BLOCK_SIZE // width)
+        for start in range(0, y_max - y_min, block_rows):
+            block = data[start : start + block_rows]
+            ys = np.arange(y_min + start, y_min + start + len(block))
+            if not (
+                np.array_equal(block[:, :, 0], np.broadcast_to(xs, block.shape[:2]))
+                and np.array_equal(
+                    block[:, :, 1], np.broadcast_to(ys[:, np.newaxis], block.shape[:2])
+                )
+            ):
+                img.fill(0)
+                return False  # pixels are not stored in row-major order, read all
+            img[:, start : start + len(block)] = np.moveaxis(
+                block[:, x_min:x_max, columns], 2, 0
+            )
+        return True
+
+    @staticmethod
+    def _create_image(
+        shape: Tuple[int, int, int],
+        dtype: np.dtype,
+        out: Optional[np.ndarray],
+        zero: bool = True,
+    ) -> np.ndarray:
+        if out is None:
+            if zero:
+                return np.zeros(shape, dtype=dtype)
+            return np.empty(shape, dtype=dtype)
+        if out.shape != shape or out.dtype != dtype or not out.flags.c_contiguous:
+            raise ValueError("out")
+        if zero:
+            out.fill(0)  # pixels missing from the data are zero
+        return out
+
+    def _read_acquisition_data(
+        self,
+        data_offset: int,
+        num_pixels: int,
+        num_channels: int,
+        use_memmap: bool,
+    ) -> np.ndarray:
+        if self._fh is None:
+            raise IOError(f"MCD file '{self.path.name}' has not been opened")
+        if use_memmap:
+            data_size = num_pixels * (num_channels + 3) * 4
+            if os.fstat(self._fh.fileno()).st_size < data_offset + data_size:
+                raise IOError(
+                    f"MCD file '{self.path.name}' corrupted: "
+                    "acquisition image data exceeds file size"
+                )
+            # mapped directly instead of with np.memmap to advise sequential access
+            map_offset = data_offset - data_offset % mmap.ALLOCATIONGRANULARITY
+            mm = mmap.mmap(
+                self._fh.fileno(),
+                data_offset - map_offset + data_size,
+                access=mmap.ACCESS_READ,
+                offset=map_offset,
+            )
+            if hasattr(mmap, "MADV_SEQUENTIAL"):  # not on Windows
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            return np.frombuffer(
+                mm,
+                dtype=np.float32,
+                count=num_pixels * (num_channels + 3),
+                offset=data_offset - map_offset,
+            ).reshape(num_pixels, num_channels + 3)
+        data = np.empty((num_pixels, num_channels + 3), dtype=np.float32)
+        if self._read_into(data.data.cast("B"), data_offset) != data.nbytes:
+            raise IOError(
+                f"MCD file '{self.path.name}' corrupted: "
+                "acquisition image data exceeds file size"
+            )
+        return data
+
     def read_slide(
         self, slide: Slide, raw: bool = False
     ) -> Union[np.ndarray, bytes, None]:
@@ -190,32 +447,14 @@ class MCDFile(IMCFile):
         :return: the slide image, or ``None`` if no image is available for the
             specified slide
         """
-        try:
-            data_start_offset = int(slide.metadata["ImageStartOffset"])
-            data_end_offset = int(slide.metadata["ImageEndOffset"])
-        except (KeyError, ValueError) as e:
-            raise IOError(
-                f"MCD file '{self.path.name}' corrupted: "
-                f"cannot locate image data for slide {slide.id}"
-            ) from e
-        if data_start_offset == data_end_offset == 0:
-            return None
-        data_start_offset += 161
-        data_end_offset -= 1
-        if data_start_offset >= data_end_offset:
-            raise IOError(
-                f"MCD file '{self.path.name}' corrupted: "
-                f"invalid image data offsets for slide {slide.id}"
-            )
-        try:
-            return self._read_image(
-                data_start_offset, data_end_offset - data_start_offset, raw
-            )
-        except Exception as e:
-            raise IOError(
-                f"MCD file '{self.path.name}' corrupted: "
-                f"cannot read image for slide {slide.id}"
-            ) from e
+        return self._read_embedded_image(
+            slide.metadata,
+            "ImageStartOffset",
+            "ImageEndOffset",
+            "image",
+            f"slide {slide.id}",
+            raw,
+        )
 
     def read_panorama(
         self, panorama: Panorama, raw: bool = False
@@ -226,32 +465,14 @@ class MCDFile(IMCFile):
         :param panorama: the panorama to read
         :return: the panorama image as numpy array
         """
-        try:
-            data_start_offset = int(panorama.metadata["ImageStartOffset"])
-            data_end_offset = int(panorama.metadata["ImageEndOffset"])
-        except (KeyError, ValueError) as e:
-            raise IOError(
-                f"MCD file '{self.path.name}' corrupted: "
-                f"cannot locate image data for panorama {panorama.id}"
-            ) from e
-        if data_start_offset == data_end_offset == 0:
-            return None
-        data_start_offset += 161
-        data_end_offset -= 1
-        if data_start_offset >= data_end_offset:
-            raise IOError(
-                f"MCD file '{self.path.name}' corrupted: "
-                f"invalid image data offsets for panorama {panorama.id}"
-            )
-        try:
-            return self._read_image(
-                data_start_offset, data_end_offset - data_start_offset, raw
-            )
-        except Exception as e:
-            raise IOError(
-                f"MCD file '{self.path.name}' corrupted: "
-                f"cannot read image for panorama {panorama.id}"
-            ) from e
+        return self._read_embedded_image(
+            panorama.metadata,
+            "ImageStartOffset",
+            "ImageEndOffset",
+            "image",
+            f"panorama {panorama.id}",
+            raw,
+        )
 
     def read_before_ablation_image(
         self, acquisition: Acquisition, raw: bool = False
@@ -264,37 +485,14 @@ class MCDFile(IMCFile):
         :return: the before-ablation image as numpy array, or ``None`` if no
             before-ablation image is available for the specified acquisition
         """
-        try:
-            data_start_offset = int(
-                acquisition.metadata["BeforeAblationImageStartOffset"]
-            )
-            data_end_offset = int(acquisition.metadata["BeforeAblationImageEndOffset"])
-        except (KeyError, ValueError) as e:
-            raise IOError(
-                f"MCD file '{self.path.name}' corrupted: "
-                f"cannot locate before-ablation image data "
-                f"for acquisition {acquisition.id}"
-            ) from e
-        if data_start_offset == data_end_offset == 0:
-            return None
-        data_start_offset += 161
-        data_end_offset -= 1
-        if data_start_offset >= data_end_offset:
-            raise IOError(
-                f"MCD file '{self.path.name}' corrupted: "
-                f"invalid before-ablation image data offsets "
-                f"for acquisition {acquisition.id}"
-            )
-        try:
-            return self._read_image(
-                data_start_offset, data_end_offset - data_start_offset, raw
-            )
-        except Exception as e:
-            raise IOError(
-                f"MCD file '{self.path.name}' corrupted: "
-                f"cannot read before-ablation image "
-                f"for acquisition {acquisition.id}"
-            ) from e
+        return self._read_embedded_image(
+            acquisition.metadata,
+            "BeforeAblationImageStartOffset",
+            "BeforeAblationImageEndOffset",
+            "before-ablation image",
+            f"acquisition {acquisition.id}",
+            raw,
+        )
 
     def read_after_ablation_image(
         self, acquisition: Acquisition, raw: bool = False
@@ -307,37 +505,14 @@ class MCDFile(IMCFile):
         :return: the after-ablation image as numpy array, or ``None`` if no
             after-ablation image is available for the specified acquisition
         """
-        try:
-            data_start_offset = int(
-                acquisition.metadata["AfterAblationImageStartOffset"]
-            )
-            data_end_offset = int(acquisition.metadata["AfterAblationImageEndOffset"])
-        except (KeyError, ValueError) as e:
-            raise IOError(
-                f"MCD file '{self.path.name}' corrupted: "
-                f"cannot locate after-ablation image data "
-                f"for acquisition {acquisition.id}"
-            ) from e
-        if data_start_offset == data_end_offset == 0:
-            return None
-        data_start_offset += 161
-        data_end_offset -= 1
-        if data_start_offset >= data_end_offset:
-            raise IOError(
-                f"MCD file '{self.path.name}' corrupted: "
-                f"invalid after-ablation image data offsets "
-                f"for acquisition {acquisition.id}"
-            )
-        try:
-            return self._read_image(
-                data_start_offset, data_end_offset - data_start_offset, raw
-            )
-        except Exception as e:
-            raise IOError(
-                f"MCD file '{self.path.name}' corrupted: "
-                f"cannot read after-ablation image "
-                f"for acquisition {acquisition.id}"
-            ) from e
+        return self._read_embedded_image(
+            acquisition.metadata,
+            "AfterAblationImageStartOffset",
+            "AfterAblationImageEndOffset",
+            "after-ablation image",
+            f"acquisition {acquisition.id}",
+            raw,
+        )
 
     def _read_schema_xml(
         self,
@@ -368,17 +543,106 @@ class MCDFile(IMCFile):
             data = mm.read(end_index + len(end_sub_encoded) - start_index)
         return data.decode(encoding=encoding)
 
+    def _read_embedded_image(
+        self,
+        metadata: Dict[str, str],
+        start_offset_key: str,
+        end_offset_key: str,
+        image_name: str,
+        owner_name: str,
+        raw: bool = False,
+    ) -> Union[np.ndarray, bytes, None]:
+        try:
+            data_start_offset = int(metadata[start_offset_key])
+            data_end_offset = int(metadata[end_offset_key])
+        except (KeyError, ValueError) as e:
+            raise IOError(
+                f"MCD file '{self.path.name}' corrupted: "
+                f"cannot locate {image_name} data for {owner_name}"
+            ) from e
+        if data_start_offset == data_end_offset == 0:
+            return None
+        # skip the .NET binary serialization record header and trailing byte
+        data_start_offset += 161
+        data_end_offset -= 1
+        if data_start_offset >= data_end_offset:
+            raise IOError(
+                f"MCD file '{self.path.name}' corrupted: "
+                f"invalid {image_name} data offsets for {owner_name}"
+            )
+        try:
+            return self._read_image(
+                data_start_offset, data_end_offset - data_start_offset, raw
+            )
+        except Exception as e:
+            raise IOError(
+                f"MCD file '{self.path.name}' corrupted: "
+                f"cannot read {image_name} for {owner_name}"
+            ) from e
+
     def _read_image(
         self, data_offset: int, data_size: int, raw: bool = False
     ) -> Union[np.ndarray, bytes]:
-        if self._fh is None:
-            raise IOError(f"MCD file '{self.path.name}' has not been opened")
-        self._fh.seek(data_offset)
-        data = self._fh.read(data_size)
+        data = self._read_bytes(data_offset, data_size)
         if raw:
             return data
         else:
             return imread(data)
 
+    def _read_bytes(self, data_offset: int, data_size: int) -> bytes:
+        if self._fh is None:
+            raise IOError(f"MCD file '{self.path.name}' has not been opened")
+        if not hasattr(os, "pread"):  # Windows
+            self._fh.seek(data_offset)
+            return self._fh.read(data_size)
+        self._advise_sequential(data_offset, data_size)
+        # pread returns the bytes without an intermediate buffer; a single call
+        # reads at most ~2 GiB on Linux, so only larger blocks are read in a loop
+        data = os.pread(self._fh.fileno(), data_size, data_offset)
+        if len(data) == data_size or len(data) == 0:
+            return data
+        buf = bytearray(data_size)
+        buf[: len(data)] = data
+        num_bytes = len(data) + self._read_into(
+            memoryview(buf)[len(data) :], data_offset + len(data)
+        )
+        return bytes(memoryview(buf)[:num_bytes])
+
+    def _read_into(self, buffer: memoryview, data_offset: int) -> int:
+        if self._fh is None:
+            raise IOError(f"MCD file '{self.path.name}' has not been opened")
+        if not hasattr(os, "pread"):  # Windows
+            self._fh.seek(data_offset)
+            return self._fh.readinto(buffer)
+        fd = self._fh.fileno()
+        data_size = len(buffer)
+        self._advise_sequential(data_offset, data_size)
+        # unlike seek + read, pread does not move the shared file position; a
+        # single call reads at most ~2 GiB on Linux, so fill the buffer in a loop
+        num_bytes = 0
+        while num_bytes < data_size:
+            if hasattr(os, "preadv"):
+                n = os.preadv(fd, [buffer[num_bytes:]], data_offset + num_bytes)
+            else:
+                chunk = os.pread(fd, data_size - num_bytes, data_offset + num_bytes)
+                n = len(chunk)
+                buffer[num_bytes : num_bytes + n] = chunk
+            if n == 0:
+                break
+            num_bytes += n
+        return num_bytes
+
+    def _advise_sequential(self, data_offset: int, data_size: int) -> None:
+        if self._fh is None:
+            raise IOError(f"MCD file '{self.path.name}' has not been opened")
+        if hasattr(os, "posix_fadvise") and data_size > 0:  # not on macOS
+            try:
+                # enlarge kernel readahead for the (potentially large) block
+                os.posix_fadvise(
+                    self._fh.fileno(), data_offset, data_size, os.POSIX_FADV_SEQUENTIAL
+                )
+            except OSError:
+                pass
+
     def __repr__(self) -> str:
         return str(self._path)
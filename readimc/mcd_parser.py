@@ -1,6 +1,7 @@
-import itertools
 import re
-from typing import Dict, List, Optional, Tuple
+import sys
+from collections import defaultdict
+from typing import DefaultDict, Dict, List, Optional, Tuple
 from warnings import warn
 from xml.etree import ElementTree as ET
 
@@ -14,8 +15,14 @@ class MCDParserError(Exception):
 
 
 class MCDParser:
-    _XMLNS_REGEX = re.compile(r"{(?P<xmlns>.*)}")
     _CHANNEL_REGEX = re.compile(r"^(?P<metal>[a-zA-Z]+)\((?P<mass>[0-9]+)\)$")
+    _FOREIGN_KEY_TAGS = {
+        "Panorama": "SlideID",
+        "AcquisitionROI": "PanoramaID",
+        "ROIPoint": "AcquisitionROIID",
+        "Acquisition": "AcquisitionROIID",
+        "AcquisitionChannel": "AcquisitionID",
+    }
 
     def __init__(self, schema_xml: str) -> None:
         """A class for parsing IMC .mcd file metadata
@@ -24,8 +31,13 @@ class MCDParser:
         """
         self._schema_xml = schema_xml
         self._schema_xml_elem = ET.fromstring(self._schema_xml)
-        m = self._XMLNS_REGEX.match(self._schema_xml_elem.tag)
-        self._schema_xml_xmlns = m.group("xmlns") if m is not None else None
+        self._schema_xml_xmlns: Optional[str] = None
+        self._xmlns_prefix = ""
+        if self._schema_xml_elem.tag.startswith("{"):
+            xmlns, _, _ = self._schema_xml_elem.tag[1:].partition("}")
+            self._schema_xml_xmlns = xmlns
+            self._xmlns_prefix = f"{{{xmlns}}}"
+        self._elems_by_foreign_key = self._index_elements()
 
     @property
     def schema_xml(self) -> str:
@@ -82,7 +94,7 @@ class MCDParser:
             self._get_text_as_int(slide_elem, "ID"),
             self._get_metadata_dict(slide_elem),
         )
-        panorama_elems = self._find_elements(f"Panorama[SlideID='{slide.id}']")
+        panorama_elems = self._find_elements_by_foreign_key("Panorama", slide.id)
         for panorama_elem in panorama_elems:
             panorama = None
             panorama_id = self._get_text_as_int(panorama_elem, "ID")
@@ -90,13 +102,13 @@ class MCDParser:
             if panorama_type != "Default":  # ignore "virtual" Panoramas
                 panorama = self._parse_panorama(panorama_elem, slide)
                 slide.panoramas.append(panorama)
-            acquisition_roi_elems = self._find_elements(
-                f"AcquisitionROI[PanoramaID='{panorama_id}']"
+            acquisition_roi_elems = self._find_elements_by_foreign_key(
+                "AcquisitionROI", panorama_id
             )
             for acquisition_roi_elem in acquisition_roi_elems:
                 acquisition_roi_id = self._get_text_as_int(acquisition_roi_elem, "ID")
-                roi_point_elems = self._find_elements(
-                    f"ROIPoint[AcquisitionROIID='{acquisition_roi_id}']"
+                roi_point_elems = self._find_elements_by_foreign_key(
+                    "ROIPoint", acquisition_roi_id
                 )
                 roi_points_um = None
                 if len(roi_point_elems) == 4:
@@ -112,8 +124,8 @@ class MCDParser:
                             ),
                         )
                     )
-                acquisition_elems = self._find_elements(
-                    f"Acquisition[AcquisitionROIID='{acquisition_roi_id}']"
+                acquisition_elems = self._find_elements_by_foreign_key(
+                    "Acquisition", acquisition_roi_id
                 )
                 for acquisition_elem in acquisition_elems:
                     acquisition = self._parse_acquisition(
@@ -122,20 +134,44 @@ class MCDParser:
                     slide.acquisitions.append(acquisition)
                     if panorama is not None:
                         panorama.acquisitions.append(acquisition)
-        for a, b in itertools.combinations(slide.acquisitions, 2):
-            a_start = int(a.metadata["DataStartOffset"])
-            a_end = int(a.metadata["DataEndOffset"])
-            b_start = int(b.metadata["DataStartOffset"])
-            b_end = int(b.metadata["DataEndOffset"])
-            if b_start <= a_start < b_end or b_start < a_end <= b_end:
-                warn(
-                    f"Slide {slide.id} corrupted: "
-                    f"overlapping memory blocks for acquisitions {a.id} and {b.id}"
-                )
+        for a, b in self._find_overlapping_acquisitions(slide.acquisitions):
+            warn(
+                f"Slide {slide.id} corrupted: "
+                f"overlapping memory blocks for acquisitions {a.id} and {b.id}"
+            )
         slide.panoramas.sort(key=lambda panorama: panorama.id)
         slide.acquisitions.sort(key=lambda acquisition: acquisition.id)
         return slide
 
+    def _find_overlapping_acquisitions(
+        self, acquisitions: List[Acquisition]
+    ) -> List[Tuple[Acquisition, Acquisition]]:
+        if len(acquisitions) < 2:
+            return []
+        offsets = [
+            (
+                int(acquisition.metadata["DataStartOffset"]),
+                int(acquisition.metadata["DataEndOffset"]),
+            )
+            for acquisition in acquisitions
+        ]
+        # sweep over the (closed) memory block spans sorted by their lower bound,
+        # only blocks with intersecting spans are candidates for overlapping
+        spans = [(min(start, end), max(start, end)) for start, end in offsets]
+        candidate_pairs: List[Tuple[int, int]] = []
+        active_indices: List[int] = []
+        for i in sorted(range(len(spans)), key=lambda i: spans[i][0]):
+            active_indices = [j for j in active_indices if spans[j][1] >= spans[i][0]]
+            candidate_pairs += [(min(i, j), max(i, j)) for j in active_indices]
+            active_indices.append(i)
+        overlapping_acquisitions = []
+        for i, j in sorted(candidate_pairs):
+            a_start, a_end = offsets[i]
+            b_start, b_end = offsets[j]
+            if b_start <= a_start < b_end or b_start < a_end <= b_end:
+                overlapping_acquisitions.append((acquisitions[i], acquisitions[j]))
+        return overlapping_acquisitions
+
     def _parse_panorama(self, panorama_elem: ET.Element, slide: Slide) -> Panorama:
         return Panorama(
             slide,
@@ -158,22 +194,17 @@ class MCDParser:
         ],
     ) -> Acquisition:
         acquisition_id = self._get_text_as_int(acquisition_elem, "ID")
-        acquisition_channel_elems = self._find_elements(
-            f"AcquisitionChannel[AcquisitionID='{acquisition_id}']"
+        acquisition_channel_elems = self._find_elements_by_foreign_key(
+            "AcquisitionChannel", acquisition_id
         )
         acquisition_channel_elems.sort(
             key=lambda acquisition_channel_elem: self._get_text_as_int(
                 acquisition_channel_elem, "OrderNumber"
             )
         )
-        acquisition = Acquisition(
-            slide,
-            panorama,
-            acquisition_id,
-            roi_points_um,
-            self._get_metadata_dict(acquisition_elem),
-            len(acquisition_channel_elems) - 3,
-        )
+        channel_metals: List[str] = []
+        channel_masses: List[int] = []
+        channel_labels: List[str] = []
         for i, acquisition_channel_elem in enumerate(acquisition_channel_elems):
             channel_name = self._get_text(acquisition_channel_elem, "ChannelName")
             if i == 0 and channel_name != "X":
@@ -195,25 +226,48 @@ class MCDParser:
                 raise MCDParserError(
                     "Cannot extract channel information "
                     f"from channel name '{channel_name}' "
-                    f"for acquisition {acquisition.id}"
+                    f"for acquisition {acquisition_id}"
                 )
             channel_label = self._get_text(acquisition_channel_elem, "ChannelLabel")
-            acquisition._channel_metals.append(m.group("metal"))
-            acquisition._channel_masses.append(int(m.group("mass")))
-            acquisition._channel_labels.append(channel_label)
-        return acquisition
+            channel_metals.append(m.group("metal"))
+            channel_masses.append(int(m.group("mass")))
+            channel_labels.append(channel_label)
+        return Acquisition(
+            slide,
+            panorama,
+            acquisition_id,
+            roi_points_um,
+            self._get_metadata_dict(acquisition_elem),
+            len(acquisition_channel_elems) - 3,
+            channel_metals,
+            channel_masses,
+            channel_labels,
+        )
 
-    def _find_elements(self, path: str) -> List[ET.Element]:
-        namespaces = None
-        if self._schema_xml_xmlns is not None:
-            namespaces = {"": self._schema_xml_xmlns}
-        return self._schema_xml_elem.findall(path, namespaces=namespaces)
+    def _find_elements(self, tag: str) -> List[ET.Element]:
+        return self._schema_xml_elem.findall(self._xmlns_prefix + tag)
+
+    def _index_elements(self) -> Dict[str, DefaultDict[str, List[ET.Element]]]:
+        elems_by_foreign_key: Dict[str, DefaultDict[str, List[ET.Element]]] = {
+            tag: defaultdict(list) for tag in self._FOREIGN_KEY_TAGS
+        }
+        for elem in self._schema_xml_elem:
+            tag = self._get_tag(elem)
+            foreign_key_tag = self._FOREIGN_KEY_TAGS.get(tag)
+            if foreign_key_tag is not None:
+                foreign_key = self._get_text_or_none(elem, foreign_key_tag)
+                if foreign_key is not None:
+                    elems_by_foreign_key[tag][foreign_key].append(elem)
+        return elems_by_foreign_key
+
+    def _find_elements_by_foreign_key(
+        self, tag: str, foreign_key: int
+    ) -> List[ET.Element]:
+        return list(self._elems_by_foreign_key[tag].get(str(foreign_key), []))
 
     def _get_text_or_none(self, parent_elem: ET.Element, tag: str) -> Optional[str]:
-        namespaces = None
-        if self._schema_xml_xmlns is not None:
-            namespaces = {"": self._schema_xml_xmlns}
-        elem = parent_elem.find(tag, namespaces=namespaces)
+        # qualified tag names without namespace mapping take the C fast path
+        elem = parent_elem.find(self._xmlns_prefix + tag)
         return (elem.text or "") if elem is not None else None
 
     def _get_text(self, parent_elem: ET.Element, tag: str) -> str:
@@ -245,10 +299,13 @@ class MCDParser:
             ) from e
 
     def _get_metadata_dict(self, parent_elem: ET.Element) -> Dict[str, str]:
-        metadata = {}
-        for elem in parent_elem:
-            tag = elem.tag
-            if self._schema_xml_xmlns is not None:
-                tag = tag.replace(f"{{{self._schema_xml_xmlns}}}", "")
-            metadata[tag] = elem.text or ""
-        return metadata
+        # share one key string per tag across all elements' metadata dicts
+        return {
+            sys.intern(self._get_tag(elem)): elem.text or "" for elem in parent_elem
+        }
+
+    def _get_tag(self, elem: ET.Element) -> str:
+        tag = elem.tag
+        if self._xmlns_prefix and tag.startswith(self._xmlns_prefix):
+            tag = tag[len(self._xmlns_prefix) :]
+        return tag
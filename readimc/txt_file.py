@@ -1,10 +1,10 @@
 import re
+from concurrent.futures import ThreadPoolExecutor
 from os import PathLike
-from typing import List, Optional, Sequence, TextIO, Tuple, Union
+from typing import BinaryIO, List, Optional, Sequence, Tuple, Union
 from warnings import warn
 
 import numpy as np
-import pandas as pd
 
 from .data import Acquisition, AcquisitionBase
 from .imc_file import IMCFile
@@ -21,7 +21,8 @@ class TXTFile(IMCFile, AcquisitionBase):
         :param path: path to the IMC .txt file
         """
         super(TXTFile, self).__init__(path)
-        self._fh: Optional[TextIO] = None
+        self._fh: Optional[BinaryIO] = None
+        self._data_offset: Optional[int] = None
         self._num_channels: Optional[int] = None
         self._channel_metals: Optional[List[str]] = None
         self._channel_masses: Optional[List[int]] = None
@@ -71,13 +72,14 @@ class TXTFile(IMCFile, AcquisitionBase):
         """
         if self._fh is not None:
             self._fh.close()
-        self._fh = open(self._path, mode="r")
+        self._fh = open(self._path, mode="rb")
         (
             self._num_channels,
             self._channel_metals,
             self._channel_masses,
             self._channel_labels,
         ) = self._read_channels()
+        self._data_offset = self._fh.tell()
 
     def close(self) -> None:
         """Closes the IMC .txt file.
@@ -105,26 +107,24 @@ class TXTFile(IMCFile, AcquisitionBase):
         :return: the acquisition data as 32-bit floating point array,
             shape: (c, y, x)
         """
-        if self._fh is None:
+        if self._fh is None or self._data_offset is None:
             raise IOError(f"TXT file '{self.path.name}' has not been opened")
-        self._fh.seek(0)
-        df = pd.read_table(self._fh, dtype=np.float32)
-        if tuple(df.columns[:3]) != (
-            "Start_push",
-            "End_push",
-            "Pushes_duration",
-        ):
-            raise IOError(
-                f"TXT file '{self.path.name}' corrupted: "
-                "push columns not found in tabular data"
-            )
-        if tuple(df.columns[3:6]) != ("X", "Y", "Z"):
-            raise IOError(
-                f"TXT file '{self.path.name}' corrupted: "
-                "XYZ channels not found in tabular data"
-            )
-        width, height = df[["X", "Y"]].add(1).max(axis=0).astype(int)
-        if width * height != len(df.index):
+        import pandas as pd  # deferred, pandas is slow to import
+
+        self._fh.seek(self._data_offset)
+        data = pd.read_csv(
+            self._fh,
+            sep="\t",
+            header=None,
+            usecols=[3, 4, *range(6, 6 + self.num_channels)],
+            dtype=np.float32,
+            engine="c",
+        ).to_numpy()
+        xs = data[:, 0].astype(np.intp)
+        ys = data[:, 1].astype(np.intp)
+        width = int(xs.max()) + 1
+        height = int(ys.max()) + 1
+        if width * height != data.shape[0]:
             if strict:
                 raise IOError(
                     f"TXT file '{self.path.name}' corrupted: "
@@ -134,15 +134,48 @@ class TXTFile(IMCFile, AcquisitionBase):
                 f"TXT file '{self.path.name}' corrupted: "
                 "inconsistent acquisition image data size"
             )
-        img = np.zeros((height, width, self.num_channels), dtype=np.float32)
-        img[df["Y"].astype(int), df["X"].astype(int), :] = df.values[:, 6:]
-        return np.moveaxis(img, -1, 0)
+        # pandas stores the columns contiguously, so the transposed channel
+        # block usually is C-contiguous already and can be returned as is
+        img = np.ascontiguousarray(data[:, 2:].T)
+        pixel_indices = ys * width + xs
+        if width * height != data.shape[0] or not np.array_equal(
+            pixel_indices, np.arange(data.shape[0])
+        ):
+            # pixels are not stored in row-major order, scatter them
+            img = np.zeros((self.num_channels, height * width), dtype=np.float32)
+            img[:, pixel_indices] = data[:, 2:].T
+        return img.reshape(self.num_channels, height, width)
+
+    @classmethod
+    def read_acquisitions(
+        cls,
+        paths: Sequence[Union[str, PathLike]],
+        strict: bool = True,
+        max_workers: Optional[int] = None,
+    ) -> List[np.ndarray]:
+        """Reads the acquisitions of multiple IMC .txt files concurrently as numpy
+        arrays.
+
+        :param paths: paths to the IMC .txt files
+        :param strict: set this parameter to False to try to recover corrupted data
+        :param max_workers: maximum number of threads to use for reading
+            (default: ``concurrent.futures.ThreadPoolExecutor`` default)
+        :return: the acquisition data as 32-bit floating point arrays, in the
+            order of the specified paths, shape: (c, y, x)
+        """
+
+        def read_acquisition(path: Union[str, PathLike]) -> np.ndarray:
+            with cls(path) as f:
+                return f.read_acquisition(strict=strict)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(read_acquisition, paths))
 
     def _read_channels(self) -> Tuple[int, List[str], List[int], List[str]]:
         if self._fh is None:
             raise IOError(f"TXT file '{self.path.name}' has not been opened")
         self._fh.seek(0)
-        columns = self._fh.readline().split("\t")
+        columns = self._fh.readline().decode("utf-8").rstrip("\r\n").split("\t")
         if tuple(columns[:3]) != ("Start_push", "End_push", "Pushes_duration"):
             raise IOError(
                 f"TXT file '{self.path.name}' corrupted: "
@@ -157,7 +190,7 @@ class TXTFile(IMCFile, AcquisitionBase):
         channel_masses: List[int] = []
         channel_labels: List[str] = []
         for column in columns[6:]:
-            m = re.match(self._CHANNEL_REGEX, column)
+            m = self._CHANNEL_REGEX.match(column)
             if m is None:
                 raise IOError(
                     f"TXT file '{self.path.name}' corrupted: "
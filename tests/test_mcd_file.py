@@ -1,5 +1,7 @@
+import shutil
 from hashlib import md5
 from pathlib import Path
+from typing import Any, List, Sequence
 
 import numpy as np
 import pytest
@@ -10,20 +12,6 @@ from readimc import MCDFile
 class TestMCDFile:
     damond_mcd_file_path = Path("data/Damond2019/20170814_G_SE.mcd")
 
-    @classmethod
-    def setup_class(cls):
-        if cls.damond_mcd_file_path.exists():
-            cls.damond_mcd_file = MCDFile(cls.damond_mcd_file_path)
-            cls.damond_mcd_file.open()
-        else:
-            cls.damond_mcd_file = None
-
-    @classmethod
-    def teardown_class(cls):
-        if cls.damond_mcd_file is not None:
-            cls.damond_mcd_file.close()
-            cls.damond_mcd_file = None
-
     def test_schema_xml(self, imc_test_data_mcd_file: MCDFile):
         digest = md5(imc_test_data_mcd_file.schema_xml.encode("utf-8")).digest()
         assert digest == b"\xac\xd8@\x0f\x0b\xf4p\x89\xdd!\xe7o\x19\xa6\x8d\x97"
@@ -100,6 +88,24 @@ class TestMCDFile:
             (31080.701956188677, 13389.195237582955),
         )
 
+    def test_slides_corrupted(self, imc_test_data_mcd_file: MCDFile, tmp_path: Path):
+        acquisition = next(
+            a for a in imc_test_data_mcd_file.slides[0].acquisitions if a.id == 1
+        )
+        expected_img = imc_test_data_mcd_file.read_acquisition(acquisition)
+        path = tmp_path / imc_test_data_mcd_file.path.name
+        path.write_bytes(
+            imc_test_data_mcd_file.path.read_bytes().replace(
+                "<ChannelName>X</ChannelName>".encode("utf-16-le"),
+                "<ChannelName>Q</ChannelName>".encode("utf-16-le"),
+            )
+        )
+        with MCDFile(path) as f:  # slide metadata is parsed on first access
+            img = f.read_acquisition(acquisition)
+            assert np.array_equal(img, expected_img)
+            with pytest.raises(IOError):
+                f.slides
+
     def test_read_acquisition(self, imc_test_data_mcd_file: MCDFile):
         slide = imc_test_data_mcd_file.slides[0]
         acquisition = next(a for a in slide.acquisitions if a.id == 1)
@@ -107,6 +113,168 @@ class TestMCDFile:
         assert img.dtype == np.float32
         assert img.shape == (5, 60, 60)
 
+    def test_read_acquisition_permuted_pixels(
+        self, imc_test_data_mcd_file: MCDFile, tmp_path: Path
+    ):
+        slide = imc_test_data_mcd_file.slides[0]
+        acquisition = next(a for a in slide.acquisitions if a.id == 1)
+        data_offset = int(acquisition.metadata["DataStartOffset"])
+        data = np.fromfile(
+            imc_test_data_mcd_file.path,
+            dtype=np.float32,
+            count=60 * 60 * (5 + 3),
+            offset=data_offset,
+        ).reshape(60 * 60, 5 + 3)
+        data = data[np.random.default_rng(0).permutation(len(data))]
+        path = tmp_path / imc_test_data_mcd_file.path.name
+        shutil.copyfile(imc_test_data_mcd_file.path, path)
+        with path.open(mode="r+b") as f:
+            f.seek(data_offset)
+            f.write(data.tobytes())
+        expected_img = np.zeros((5, 60, 60), dtype=np.float32)
+        expected_img[:, data[:, 1].astype(int), data[:, 0].astype(int)] = data[:, 3:].T
+        with MCDFile(path) as f:
+            acquisition = next(a for a in f.slides[0].acquisitions if a.id == 1)
+            for use_memmap in (True, False):
+                img = f.read_acquisition(acquisition=acquisition, use_memmap=use_memmap)
+                assert np.array_equal(img, expected_img)
+            img = f.read_acquisition(acquisition=acquisition, region=(10, 20, 50, 40))
+            assert np.array_equal(img, expected_img[:, 20:40, 10:50])
+
+    def test_read_acquisition_duplicate_pixels(
+        self, imc_test_data_mcd_file: MCDFile, tmp_path: Path, monkeypatch
+    ):
+        slide = imc_test_data_mcd_file.slides[0]
+        acquisition = next(a for a in slide.acquisitions if a.id == 1)
+        data_offset = int(acquisition.metadata["DataStartOffset"])
+        data = np.fromfile(
+            imc_test_data_mcd_file.path,
+            dtype=np.float32,
+            count=60 * 60 * (5 + 3),
+            offset=data_offset,
+        ).reshape(60 * 60, 5 + 3)
+        data[50 * 60 + 7, :2] = data[10 * 60 + 3, :2]  # pixel (7, 50) is missing
+        path = tmp_path / imc_test_data_mcd_file.path.name
+        shutil.copyfile(imc_test_data_mcd_file.path, path)
+        with path.open(mode="r+b") as f:
+            f.seek(data_offset)
+            f.write(data.tobytes())
+        expected_img = np.zeros((5, 60, 60), dtype=np.float32)
+        expected_img[:, data[:, 1].astype(int), data[:, 0].astype(int)] = data[:, 3:].T
+        # pixels are row-major for the first blocks, out of order in a later block
+        monkeypatch.setattr(MCDFile, "_SCATTER_BLOCK_SIZE", 1000)
+        with MCDFile(path) as f:
+            acquisition = next(a for a in f.slides[0].acquisitions if a.id == 1)
+            img = f.read_acquisition(acquisition=acquisition)
+            assert np.array_equal(img, expected_img)
+            out = np.full((5, 60, 60), np.nan, dtype=np.float32)
+            f.read_acquisition(acquisition=acquisition, out=out)
+            assert np.array_equal(out, expected_img)
+
+    def test_read_acquisition_missing_pixels(self, imc_test_data_mcd_file: MCDFile):
+        slide = imc_test_data_mcd_file.slides[0]
+        acquisition = next(a for a in slide.acquisitions if a.id == 1)
+        data_offset = int(acquisition.metadata["DataStartOffset"])
+        data = np.fromfile(
+            imc_test_data_mcd_file.path,
+            dtype=np.float32,
+            count=60 * 59 * (5 + 3),
+            offset=data_offset,
+        ).reshape(60 * 59, 5 + 3)
+        acquisition.metadata["DataEndOffset"] = str(data_offset + data.nbytes)
+        expected_img = np.zeros((5, 60, 60), dtype=np.float32)
+        expected_img[:, data[:, 1].astype(int), data[:, 0].astype(int)] = data[:, 3:].T
+        with pytest.raises(IOError):
+            imc_test_data_mcd_file.read_acquisition(acquisition=acquisition)
+        for use_memmap in (True, False):
+            with pytest.warns(UserWarning):
+                img = imc_test_data_mcd_file.read_acquisition(
+                    acquisition=acquisition, strict=False, use_memmap=use_memmap
+                )
+            assert np.array_equal(img, expected_img)
+        with pytest.warns(UserWarning):
+            img = imc_test_data_mcd_file.read_acquisition(
+                acquisition=acquisition, strict=False, region=(0, 50, 60, 60)
+            )
+        assert np.array_equal(img, expected_img[:, 50:60, 0:60])
+
+    def test_read_acquisition_memmap(self, imc_test_data_mcd_file: MCDFile):
+        slide = imc_test_data_mcd_file.slides[0]
+        acquisition = next(a for a in slide.acquisitions if a.id == 1)
+        for region in (None, (10, 20, 50, 40)):
+            img = imc_test_data_mcd_file.read_acquisition(
+                acquisition=acquisition, region=region
+            )
+            expected_img = imc_test_data_mcd_file.read_acquisition(
+                acquisition=acquisition, region=region, use_memmap=False
+            )
+            assert np.array_equal(img, expected_img)
+
+    def test_read_acquisition_region(self, imc_test_data_mcd_file: MCDFile):
+        slide = imc_test_data_mcd_file.slides[0]
+        acquisition = next(a for a in slide.acquisitions if a.id == 1)
+        img = imc_test_data_mcd_file.read_acquisition(
+            acquisition=acquisition, region=(10, 20, 50, 40)
+        )
+        expected_img = imc_test_data_mcd_file.read_acquisition(acquisition)
+        assert np.array_equal(img, expected_img[:, 20:40, 10:50])
+        with pytest.raises(ValueError):
+            imc_test_data_mcd_file.read_acquisition(
+                acquisition=acquisition, region=(0, 0, 61, 60)
+            )
+
+    def test_read_acquisition_channels(self, imc_test_data_mcd_file: MCDFile):
+        slide = imc_test_data_mcd_file.slides[0]
+        acquisition = next(a for a in slide.acquisitions if a.id == 1)
+        img = imc_test_data_mcd_file.read_acquisition(
+            acquisition=acquisition, channels=[0, 2]
+        )
+        expected_img = imc_test_data_mcd_file.read_acquisition(acquisition)
+        assert np.array_equal(img, expected_img[[0, 2]])
+        invalid_channels: List[Sequence[Any]] = [[], [5], [-1], [1.0], [np.float64(2)]]
+        for channels in invalid_channels:
+            with pytest.raises(ValueError):
+                imc_test_data_mcd_file.read_acquisition(
+                    acquisition=acquisition, channels=channels
+                )
+        img = imc_test_data_mcd_file.read_acquisition(
+            acquisition=acquisition, channels=np.array([0, 2])
+        )
+        assert np.array_equal(img, expected_img[[0, 2]])
+
+    def test_read_acquisition_out(self, imc_test_data_mcd_file: MCDFile, tmp_path):
+        slide = imc_test_data_mcd_file.slides[0]
+        acquisition = next(a for a in slide.acquisitions if a.id == 1)
+        out = np.memmap(
+            tmp_path / "img.dat", dtype=np.float32, mode="w+", shape=(5, 60, 60)
+        )
+        img = imc_test_data_mcd_file.read_acquisition(acquisition=acquisition, out=out)
+        assert img is out
+        expected_img = imc_test_data_mcd_file.read_acquisition(acquisition)
+        assert np.array_equal(out, expected_img)
+        with pytest.raises(ValueError):
+            imc_test_data_mcd_file.read_acquisition(
+                acquisition=acquisition, out=np.empty((5, 60, 61), dtype=np.float32)
+            )
+
+    def test_read_acquisition_fp16(self, imc_test_data_mcd_file: MCDFile):
+        slide = imc_test_data_mcd_file.slides[0]
+        acquisition = next(a for a in slide.acquisitions if a.id == 1)
+        img = imc_test_data_mcd_file.read_acquisition(
+            acquisition=acquisition, dtype=np.float16
+        )
+        assert img.dtype == np.float16
+        expected_img = imc_test_data_mcd_file.read_acquisition(acquisition)
+        assert np.array_equal(img, expected_img.astype(np.float16))
+
+    def test_read_acquisitions(self, imc_test_data_mcd_file: MCDFile):
+        slide = imc_test_data_mcd_file.slides[0]
+        imgs = imc_test_data_mcd_file.read_acquisitions(slide.acquisitions)
+        assert len(imgs) == len(slide.acquisitions)
+        for acquisition, img in zip(slide.acquisitions, imgs):
+            expected_img = imc_test_data_mcd_file.read_acquisition(acquisition)
+            assert np.array_equal(img, expected_img)
+
     def test_read_slide(self, imc_test_data_mcd_file: MCDFile):
         slide = imc_test_data_mcd_file.slides[0]
         img = imc_test_data_mcd_file.read_slide(slide)
@@ -139,10 +307,10 @@ class TestMCDFile:
         assert digest == b"\xac\xd8@\x0f\x0b\xf4p\x89\xdd!\xe7o\x19\xa6\x8d\x97"
 
     @pytest.mark.skipif(not damond_mcd_file_path.exists(), reason="data not available")
-    def test_slides_damond(self):
-        assert len(self.damond_mcd_file.slides) == 1
+    def test_slides_damond(self, damond_mcd_file: MCDFile):
+        assert len(damond_mcd_file.slides) == 1
 
-        slide = self.damond_mcd_file.slides[0]
+        slide = damond_mcd_file.slides[0]
         assert slide.id == 1
         assert slide.description == "compensationslide1000"
         assert slide.width_um == 75000.0
@@ -189,38 +357,40 @@ class TestMCDFile:
         assert acquisition.roi_coords_um is None
 
     @pytest.mark.skipif(not damond_mcd_file_path.exists(), reason="data not available")
-    def test_read_acquisition_damond(self):
-        slide = self.damond_mcd_file.slides[0]
+    def test_read_acquisition_damond(self, damond_mcd_file: MCDFile):
+        slide = damond_mcd_file.slides[0]
         acquisition = next(a for a in slide.acquisitions if a.id == 1)
-        img = self.damond_mcd_file.read_acquisition(acquisition=acquisition)
+        img = damond_mcd_file.read_acquisition(acquisition=acquisition)
         assert img.dtype == np.float32
         assert img.shape == (3, 50, 51)
 
     @pytest.mark.skipif(not damond_mcd_file_path.exists(), reason="data not available")
-    def test_read_slide_damond(self):
-        slide = self.damond_mcd_file.slides[0]
-        img = self.damond_mcd_file.read_slide(slide)
+    def test_read_slide_damond(self, damond_mcd_file: MCDFile):
+        slide = damond_mcd_file.slides[0]
+        img = damond_mcd_file.read_slide(slide)
+        assert isinstance(img, np.ndarray)
         assert img.dtype == np.uint8
         assert img.shape == (930, 2734, 3)
 
     @pytest.mark.skipif(not damond_mcd_file_path.exists(), reason="data not available")
-    def test_read_panorama_damond(self):
-        slide = self.damond_mcd_file.slides[0]
+    def test_read_panorama_damond(self, damond_mcd_file: MCDFile):
+        slide = damond_mcd_file.slides[0]
         panorama = next(p for p in slide.panoramas if p.id == 1)
-        img = self.damond_mcd_file.read_panorama(panorama)
+        img = damond_mcd_file.read_panorama(panorama)
+        assert isinstance(img, np.ndarray)
         assert img.dtype == np.uint8
         assert img.shape == (4096, 3951, 4)
 
     @pytest.mark.skipif(not damond_mcd_file_path.exists(), reason="data not available")
-    def test_read_before_ablation_image_damond(self):
-        slide = self.damond_mcd_file.slides[0]
+    def test_read_before_ablation_image_damond(self, damond_mcd_file: MCDFile):
+        slide = damond_mcd_file.slides[0]
         acquisition = next(a for a in slide.acquisitions if a.id == 1)
-        img = self.damond_mcd_file.read_before_ablation_image(acquisition)
+        img = damond_mcd_file.read_before_ablation_image(acquisition)
         assert img is None
 
     @pytest.mark.skipif(not damond_mcd_file_path.exists(), reason="data not available")
-    def test_read_after_ablation_image_damond(self):
-        slide = self.damond_mcd_file.slides[0]
+    def test_read_after_ablation_image_damond(self, damond_mcd_file: MCDFile):
+        slide = damond_mcd_file.slides[0]
         acquisition = next(a for a in slide.acquisitions if a.id == 1)
-        img = self.damond_mcd_file.read_after_ablation_image(acquisition)
+        img = damond_mcd_file.read_after_ablation_image(acquisition)
         assert img is None
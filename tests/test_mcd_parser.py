@@ -8,20 +8,6 @@ from readimc import MCDFile, MCDParser
 class TestMCDParser:
     damond_mcd_file_path = Path("data/Damond2019/20170814_G_SE.mcd")
 
-    @classmethod
-    def setup_class(cls):
-        if cls.damond_mcd_file_path.exists():
-            cls.damond_mcd_file = MCDFile(cls.damond_mcd_file_path)
-            cls.damond_mcd_file.open()
-        else:
-            cls.damond_mcd_file = None
-
-    @classmethod
-    def teardown_class(cls):
-        if cls.damond_mcd_file is not None:
-            cls.damond_mcd_file.close()
-            cls.damond_mcd_file = None
-
     def test_schema_xml(self):
         pass  # TODO
 
@@ -118,8 +104,8 @@ class TestMCDParser:
         pass  # TODO
 
     @pytest.mark.skipif(not damond_mcd_file_path.exists(), reason="data not available")
-    def test_parse_slides_damond(self):
-        parser = MCDParser(self.damond_mcd_file.schema_xml)
+    def test_parse_slides_damond(self, damond_mcd_file: MCDFile):
+        parser = MCDParser(damond_mcd_file.schema_xml)
         slides = parser.parse_slides()
         assert len(slides) == 1
 
@@ -1,4 +1,7 @@
+from pathlib import Path
+
 import numpy as np
+import pytest
 
 from readimc import TXTFile
 
@@ -47,3 +50,39 @@ class TestTXTFile:
         img = imc_test_data_txt_file.read_acquisition()
         assert img.dtype == np.float32
         assert img.shape == (5, 60, 60)
+
+    def test_read_acquisition_permuted_pixels(
+        self, imc_test_data_txt_file: TXTFile, tmp_path: Path
+    ):
+        header, *rows = imc_test_data_txt_file.path.read_text().splitlines(True)
+        rows = [rows[i] for i in np.random.default_rng(0).permutation(len(rows))]
+        path = tmp_path / imc_test_data_txt_file.path.name
+        path.write_text(header + "".join(rows))
+        expected_img = imc_test_data_txt_file.read_acquisition()
+        with TXTFile(path) as f:
+            img = f.read_acquisition()
+        assert np.array_equal(img, expected_img)
+
+    def test_read_acquisition_missing_pixels(
+        self, imc_test_data_txt_file: TXTFile, tmp_path: Path
+    ):
+        header, *rows = imc_test_data_txt_file.path.read_text().splitlines(True)
+        del rows[30 * 60 : 31 * 60]  # image row y = 30
+        path = tmp_path / imc_test_data_txt_file.path.name
+        path.write_text(header + "".join(rows))
+        expected_img = imc_test_data_txt_file.read_acquisition()
+        expected_img[:, 30, :] = 0
+        with TXTFile(path) as f:
+            with pytest.raises(IOError):
+                f.read_acquisition()
+            with pytest.warns(UserWarning):
+                img = f.read_acquisition(strict=False)
+        assert np.array_equal(img, expected_img)
+
+    def test_read_acquisitions(self, imc_test_data_txt_file: TXTFile):
+        path = imc_test_data_txt_file.path
+        imgs = TXTFile.read_acquisitions([path, path])
+        assert len(imgs) == 2
+        expected_img = imc_test_data_txt_file.read_acquisition()
+        for img in imgs:
+            assert np.array_equal(img, expected_img)